@@ -1,28 +1,37 @@
+from functools import lru_cache
+
 s = "Raindrops on roses"
 idx = 0
 count = 0
-vowels = ['a','e','i','o','u','A','E','I','O','U']
+VOWELS = frozenset('aeiouAEIOU')
+# every byte value that is not a vowel, for bytes.translate to delete
+NON_VOWEL_BYTES = bytes(b for b in range(256) if chr(b) not in VOWELS)
+
+# loop - map/sum keep the iteration in C
+def count_vowels_loop(s):
+  return sum(map(VOWELS.__contains__, s))
 
-# loop
+# byte table - translate drops every non-vowel byte in C, what's left are the vowels
+# (all vowels are ASCII, so ignoring non-ASCII characters doesn't change the count)
+# cached, so repeated strings are only counted once
+@lru_cache(maxsize=4096)
 def count_vowels(s):
-  count = 0
-  for char in s:
-    if char in vowels:
-      count += 1
+  return len(s.encode('ascii', 'ignore').translate(None, NON_VOWEL_BYTES))
+
+# recursion, unrolled - Python has no tail-call optimization, so the
+# accumulator version becomes a loop: same arguments, constant stack
+def count_vowels_accumulate(s, idx, count):
+  while idx < len(s):
+    # True/False add up as 1/0
+    count += s[idx] in VOWELS
+    idx += 1
   return count
 
-# res = count_vowels(s)
+# res = count_vowels_loop(s)
 # print(res)
 
-# recursion
-def count_vowels(s, idx, count):
-  # exit condition
-  if idx == len(s):
-    return count
-  else:
-    if s[idx] in vowels:
-      count += 1
-    return count_vowels(s, idx+1, count)
+# res = count_vowels_accumulate(s, idx, count)
+# print(res)
 
-res = count_vowels(s, idx, count)
+res = count_vowels(s)
 print(res)
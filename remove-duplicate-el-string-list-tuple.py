@@ -1,56 +1,48 @@
 # approach #1 - using temp variables
-
-s = 'Razmattaz'
-lst = ['R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z']
-tpl = ('R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z')
-
-# using temporary set to remove
-# all duplicate elements present in a string, list, and tuple
-tmp_set = set()
-
-# string subtask
-tmp_str = ''
-for char in s :
-  if (char not in tmp_set) :
-    tmp_str += char
-  tmp_set.add(char)
-# clearing set
-tmp_set.clear()
-# changing s
-s = tmp_str
-
-# list subtask
-tmp_lst = []
-for el in lst:
-  if (el not in tmp_set):
-    tmp_lst.append(el)
-  tmp_set.add(el)
-# clearing set
-tmp_set.clear()
-lst = tmp_lst
-
-# tuple subtask
-tpl = tuple(lst)
-
-# output
-print(s)
-print(lst)
-print(tpl)
-
-
-
-# approach #2 - using sorted
-s = 'Razmattaz'
-lst = ['R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z']
-tpl = ('R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z')
-
-s = ''.join(sorted(set(s), key = s.index))
-print(s)
-
-lst = ['R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z']
-lst = list(sorted(set(lst), key = s.index))
-print(lst)
-
-tpl = ('R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z')
-tpl = tuple(sorted(set(tpl), key = s.index))
-print(tpl)
+def approach_1():
+  s = 'Razmattaz'
+  lst = ['R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z']
+  tpl = ('R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z')
+
+  # using temporary set to remove
+  # all duplicate elements present in a string, list, and tuple
+  tmp_set = set()
+  # binding the method once saves an attribute lookup per element;
+  # `or` only calls it for elements not seen yet (add returns None)
+  tmp_set_add = tmp_set.add
+
+  # s, lst and tpl hold the same chars, so dedup once and derive the rest
+  lst = [el for el in lst if not (el in tmp_set or tmp_set_add(el))]
+  # joining once instead of `+=` per char, which can copy the string every time
+  s = ''.join(lst)
+  tpl = tuple(lst)
+
+  # output
+  print(s)
+  print(lst)
+  print(tpl)
+
+
+# approach #2 - using dict.fromkeys (dicts keep insertion order)
+def approach_2():
+  s = 'Razmattaz'
+  lst = ['R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z']
+  tpl = ('R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z')
+
+  s = ''.join(dict.fromkeys(s))
+  print(s)
+
+  lst = ['R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z']
+  lst = list(dict.fromkeys(lst))
+  print(lst)
+
+  tpl = ('R', 'a', 'a', 'z', 'm', 'a', 't', 't', 'a', 'z')
+  tpl = tuple(dict.fromkeys(tpl))
+  print(tpl)
+
+def main():
+  approach_1()
+  approach_2()
+
+if __name__ == '__main__':
+  main()
@@ -1,16 +1,16 @@
-st = {'Amelia', 'Ava', 'Alexander', 'Avery', 'Asher', 'Bam', 'Bob', 'Bali', 'Bela', 'Boni'}
+def main():
+  st = {'Amelia', 'Ava', 'Alexander', 'Avery', 'Asher', 'Bam', 'Bob', 'Bali', 'Bela', 'Boni'}
 
-a_set = set()
-b_set = set()
+  # comparing the first char directly is cheaper than a startswith() call
+  a_set = {el for el in st if el[0] == 'A'}
+  # everything that didn't go to a_set, as a single set difference
+  b_set = st - a_set
 
-for el in st:
-  if (el.startswith('A')):
-    a_set.add(el)
-  else:
-    b_set.add(el)
+  print(a_set)
+  print(b_set)
 
-print(a_set)
-print(b_set)
+  # print(tuple(sorted(a_set)))
+  # print(tuple(sorted(b_set)))
 
-# print(tuple(sorted(a_set)))
-# print(tuple(sorted(b_set)))
+if __name__ == '__main__':
+  main()
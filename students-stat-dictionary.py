@@ -1,20 +1,26 @@
-students = {
-               'John' : { 'Math' : 48, 'English' : 60, 'Science' : 95},
-               'Richard' : { 'Math' : 75,'English' : 68,'Science' : 89},
-               'Charles' : { 'Math' : 45,'English' : 66,'Science' : 87}
-           }
-students_stat = {}
-max_average = -1
-max_student = None
-for student,stat in students.items():
-  total = sum(stat.values())
-  average = total // len(stat)
-  if average > max_average:
-    max_average = average
-    max_student = student
-  students_stat[student] = {}
-  students_stat[student]['Total'] = total
-  students_stat[student]['Average'] = average
-print(students_stat)
-print('Top student of the class:', max_student)
-print('Top student\'s score:', max_average)
+from collections import namedtuple
+
+# lighter than a dict per student, still readable by field name
+StudentStat = namedtuple('StudentStat', ('total', 'average'))
+
+def main():
+  students = {
+                 'John' : { 'Math' : 48, 'English' : 60, 'Science' : 95},
+                 'Richard' : { 'Math' : 75,'English' : 68,'Science' : 89},
+                 'Charles' : { 'Math' : 45,'English' : 66,'Science' : 87}
+             }
+  # every student has the same subjects, so count them once
+  n_subjects = len(next(iter(students.values())))
+  students_stat = {
+    student: StudentStat(total := sum(stat.values()), total // n_subjects)
+    for student, stat in students.items()
+  }
+  # picking the top student in a separate pass
+  max_student = max(students_stat, key=lambda student: students_stat[student].average)
+  max_average = students_stat[max_student].average
+  print(students_stat)
+  print('Top student of the class:', max_student)
+  print('Top student\'s score:', max_average)
+
+if __name__ == '__main__':
+  main()